@@ -10,7 +10,7 @@ from pydantic import ValidationError, model_validator
 from .commonmodel import CommonModel
 from .gql import gql_identifier_adapter, int_adapter
 from .graphconnection import GraphConnection
-from .schema_utils import NodeSchema, SchemaProperty, extract_type_mapping
+from .schema_utils import NodeSchema, get_schema_properties
 
 
 def _find_this_node(query, params, node):
@@ -92,6 +92,15 @@ class BaseNode(CommonModel):  # pyre-ignore[13]
                 "Nodes to be used in the graph must define a primary label."
             )
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+
+        # a new node type invalidates any cached node and relationship types
+        from .utils import _clear_type_caches
+
+        _clear_type_caches()
+
     def __str__(self) -> str:
         return str(self.get_pp())
 
@@ -546,27 +555,7 @@ class BaseNode(CommonModel):  # pyre-ignore[13]
         schema_dict["title"] = cls.__name__
         schema_dict["secondary_labels"] = cls.__secondarylabels__
 
-        model_properties: list = []
-
-        for field_name, field_props in cls.model_fields.items():
-            field_type = extract_type_mapping(
-                field_props.annotation, show_optional=True
-            )
-
-            node_property = SchemaProperty(
-                type_annotation=field_type,
-                name=field_name,
-                required=field_props.is_required(),
-            )
-
-            if field_props.is_required() is True:
-                model_properties.insert(0, node_property)
-
-            # put optional fields at the end
-            else:
-                model_properties.append(node_property)
-
-        schema_dict["properties"] = model_properties
+        schema_dict["properties"] = list(get_schema_properties(cls))
         schema_dict["outgoing_relationships"] = []
 
         if include_outgoing_rels is False:
@@ -575,7 +564,7 @@ class BaseNode(CommonModel):  # pyre-ignore[13]
         else:
             from .utils import get_rels_by_source, get_rels_by_type
 
-            outgoing_rels = get_rels_by_source().get(cls.__primarylabel__, set())
+            outgoing_rels = get_rels_by_source().get(cls.__primarylabel__, frozenset())
             all_rel_types = get_rels_by_type()
 
             for rel in outgoing_rels:
@@ -12,7 +12,7 @@ from neontology.graphconnection import GraphConnection
 from .basenode import BaseNode
 from .commonmodel import CommonModel
 from .gql import gql_identifier_adapter
-from .schema_utils import RelationshipSchema, SchemaProperty, extract_type_mapping
+from .schema_utils import RelationshipSchema, get_schema_properties
 
 R = TypeVar("R", bound="BaseRelationship")
 
@@ -38,6 +38,15 @@ class BaseRelationship(CommonModel):  # pyre-ignore[13]
                 "Relationships to be used in the graph must define a relationship type."
             )
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+
+        # a new relationship type invalidates any cached node and relationship types
+        from .utils import _clear_type_caches
+
+        _clear_type_caches()
+
     @classmethod
     def _set_prop_usage(cls) -> None:
         super()._set_prop_usage()
@@ -380,33 +389,14 @@ class BaseRelationship(CommonModel):  # pyre-ignore[13]
         source_labels: Optional[List[str]] = None,
         target_labels: Optional[List[str]] = None,
     ) -> RelationshipSchema:
-        schema_properties = []
         rel_type = cls.__relationshiptype__
 
         if not rel_type:
             raise ValueError("Relationship doesn't have a relationship type.")
 
-        for field_name, field_props in cls.model_fields.items():
-            if field_name in ["source", "target"]:
-                continue
-
-            field_type = extract_type_mapping(
-                field_props.annotation, show_optional=True
-            )
-
-            required_field = field_props.is_required()
-
-            rel_prop = SchemaProperty(
-                type_annotation=field_type,
-                name=field_name,
-                required=required_field,
-            )
-
-            if required_field is True:
-                schema_properties.insert(0, rel_prop)
-
-            else:
-                schema_properties.append(rel_prop)
+        schema_properties = list(
+            get_schema_properties(cls, exclude=frozenset({"source", "target"}))
+        )
 
         source_type = cls.model_fields["source"].annotation
         target_type = cls.model_fields["target"].annotation
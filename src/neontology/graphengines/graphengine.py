@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import date, datetime, time, timedelta
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel
 
@@ -103,9 +103,33 @@ class GraphEngineBase:
     def apply_constraint(self, label: str, property: str) -> None:
         raise NotImplementedError
 
+    def apply_constraints(self, constraints: List[Tuple[str, str]]) -> None:
+        """Apply multiple uniqueness constraints.
+
+        Engines which can apply constraints in a single round trip should override this.
+
+        Args:
+            constraints (List[Tuple[str, str]]): (label, property) pairs to constrain.
+        """
+
+        for label, property in constraints:
+            self.apply_constraint(label, property)
+
     def drop_constraint(self, constraint_name: str) -> None:
         raise NotImplementedError
 
+    def drop_constraints(self, constraint_names: List[str]) -> None:
+        """Drop multiple constraints.
+
+        Engines which can drop constraints in a single round trip should override this.
+
+        Args:
+            constraint_names (List[str]): names of the constraints to drop.
+        """
+
+        for constraint_name in constraint_names:
+            self.drop_constraint(constraint_name)
+
     def get_constraints(self) -> list:
         raise NotImplementedError
 
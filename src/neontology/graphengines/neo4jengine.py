@@ -1,7 +1,6 @@
-import itertools
 import os
 import warnings
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Tuple
 
 from dotenv import load_dotenv
 from neo4j import GraphDatabase
@@ -75,7 +74,7 @@ def neo4j_relationship_to_neontology_rel(
     neo4j_rel: Neo4jRelationship, node_classes: dict, rel_classes: dict
 ) -> Optional["BaseRelationship"]:
     rel_type = neo4j_rel.type
-    rel_type_data = rel_classes[rel_type]
+    rel_type_data = rel_classes.get(rel_type)
 
     if not rel_type_data:
         warnings.warn(
@@ -118,6 +117,11 @@ def neo4j_records_to_neontology_records(
 ) -> tuple:
     new_records = []
 
+    # collect flat lists as we go rather than re-walking every record afterwards
+    nodes: List["BaseNode"] = []
+    rels: List["BaseRelationship"] = []
+    paths: List[list] = []
+
     for record in records:
         new_record: Dict[str, dict] = {"nodes": {}, "relationships": {}, "paths": {}}
 
@@ -127,6 +131,7 @@ def neo4j_records_to_neontology_records(
 
                 if neontology_node:
                     new_record["nodes"][key] = neontology_node
+                    nodes.append(neontology_node)
 
             elif isinstance(entry, Neo4jRelationship):
                 neontology_rel = neo4j_relationship_to_neontology_rel(
@@ -135,6 +140,7 @@ def neo4j_records_to_neontology_records(
 
                 if neontology_rel:
                     new_record["relationships"][key] = neontology_rel
+                    rels.append(neontology_rel)
 
             elif isinstance(entry, Neo4jPath):
                 entry_path = []
@@ -145,23 +151,14 @@ def neo4j_records_to_neontology_records(
                     entry_path.append(step_rel)
                 if entry_path:
                     new_record["paths"][key] = entry_path
+                    paths.append(entry_path)
 
         new_records.append(new_record)
 
-    nodes_list_of_lists = [x["nodes"].values() for x in new_records]
-
-    nodes = list(itertools.chain.from_iterable(nodes_list_of_lists))
-
     nodes_map = {f"{x.__primarylabel__}:{x.get_pp()}": x for x in nodes}
 
     unique_nodes = list(nodes_map.values())
 
-    rels_list_of_lists = [x["relationships"].values() for x in new_records]
-    rels = list(itertools.chain.from_iterable(rels_list_of_lists))
-
-    paths_list_of_lists = [x["paths"].values() for x in new_records]
-    paths = list(itertools.chain.from_iterable(paths_list_of_lists))
-
     return new_records, unique_nodes, rels, paths
 
 
@@ -224,20 +221,59 @@ class Neo4jEngine(GraphEngineBase):
         else:
             return None
 
-    def apply_constraint(self, label: str, property: str) -> None:
-        cypher = f"""
+    @staticmethod
+    def _constraint_cypher(label: str, property: str) -> str:
+        return f"""
         CREATE CONSTRAINT IF NOT EXISTS
         FOR (n:{gql_identifier_adapter.validate_strings(label)})
         REQUIRE n.{gql_identifier_adapter.validate_strings(property)} IS UNIQUE
         """
 
-        self.evaluate_query_single(cypher)
+    def apply_constraint(self, label: str, property: str) -> None:
+        self.evaluate_query_single(self._constraint_cypher(label, property))
+
+    def apply_constraints(self, constraints: List[Tuple[str, str]]) -> None:
+        # validate everything before we start so we don't partially apply constraints
+        cypher_statements = [
+            self._constraint_cypher(label, property) for label, property in constraints
+        ]
 
-    def drop_constraint(self, constraint_name: str) -> None:
-        drop_cypher = f"""
+        if not cypher_statements:
+            return
+
+        def create_constraints(tx: Any) -> None:
+            for cypher in cypher_statements:
+                tx.run(cypher).consume()
+
+        # schema changes can share a transaction, so apply them all in one go
+        with self.driver.session() as session:
+            session.execute_write(create_constraints)
+
+    @staticmethod
+    def _drop_constraint_cypher(constraint_name: str) -> str:
+        return f"""
         DROP CONSTRAINT {gql_identifier_adapter.validate_strings(constraint_name)}
         """
-        self.evaluate_query_single(drop_cypher)
+
+    def drop_constraint(self, constraint_name: str) -> None:
+        self.evaluate_query_single(self._drop_constraint_cypher(constraint_name))
+
+    def drop_constraints(self, constraint_names: List[str]) -> None:
+        # validate everything before we start so we don't partially drop constraints
+        cypher_statements = [
+            self._drop_constraint_cypher(constraint_name)
+            for constraint_name in constraint_names
+        ]
+
+        if not cypher_statements:
+            return
+
+        def drop_all(tx: Any) -> None:
+            for cypher in cypher_statements:
+                tx.run(cypher).consume()
+
+        with self.driver.session() as session:
+            session.execute_write(drop_all)
 
     def get_constraints(self) -> list:
         get_constraints_query = """
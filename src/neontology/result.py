@@ -50,6 +50,8 @@ class NeontologyResult(BaseModel):
         return data
 
     def neontology_dump_json(self) -> str:
+        # go via each entry's own json dump so that pydantic's json handling
+        # (e.g. writing non-finite floats as null) is used
         nodes = [json.loads(x.neontology_dump_json()) for x in self.nodes]
         relationships = [
             json.loads(x.neontology_dump_json()) for x in self.relationships
@@ -1,16 +1,41 @@
 from __future__ import annotations
 
 import enum
+import functools
 from logging import getLogger
-from typing import Any, List, Optional, Union, get_args, get_origin
-
-from jinja2 import Template
-from pydantic import BaseModel
+from typing import (
+    Any,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, ConfigDict
 
 logger = getLogger(__name__)
 
+_MD_TABLE_HEADER = (
+    "| Property Name | Type | Required |\n| ------------- | ---- | -------- |"
+)
+
+
+def _md_properties_table(properties: List[SchemaProperty]) -> str:
+    rows = [
+        f"| {x.name} | {x.type_annotation.representation} | {x.required} |"
+        for x in properties
+    ]
+
+    return "\n".join([_MD_TABLE_HEADER, *rows])
+
 
 class NeontologyAnnotationData(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     representation: str
     core_type: Any
     optional: bool = False
@@ -19,12 +44,16 @@ class NeontologyAnnotationData(BaseModel):
 
 
 class SchemaProperty(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str
     type_annotation: NeontologyAnnotationData
     required: bool
 
 
 class RelationshipSchema(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str
     relationship_type: str
     source_labels: List[str]
@@ -34,6 +63,8 @@ class RelationshipSchema(BaseModel):
 
 
 class NodeSchema(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     label: str
     title: str
     secondary_labels: List[str]
@@ -43,48 +74,42 @@ class NodeSchema(BaseModel):
     def md_node_table(self) -> str:
         """Take a node schema and produce markdown ontology documentation"""
 
-        schema_template_raw = """
-| Property Name | Type | Required |
-| ------------- | ---- | -------- |
-{% for field in model_schema.properties -%}
-| {{field.name}} | {{field.type_annotation.representation}} | {{field.required}} |
-{% endfor %}
-"""
-
-        schema_template = Template(schema_template_raw)
-
-        return schema_template.render(model_schema=self).strip()
+        return _md_properties_table(self.properties)
 
     def md_rel_tables(self, heading_level: int = 3) -> str:
         """Take a node schema and produce markdown ontology documentation"""
 
-        schema_template_raw = """
-{% if model_schema.outgoing_relationships %}
-{% for outgoing_rel in model_schema.outgoing_relationships -%}
-{{"#"*heading_level}} {{ outgoing_rel.relationship_type }}
+        sections = []
 
-Target Label(s): {{ outgoing_rel.target_labels |join(', ') }}
-{% if outgoing_rel.properties %}
-| Property Name | Type | Required |
-| ------------- | ---- | -------- |
-{% for rel_prop in outgoing_rel.properties -%}
-| {{rel_prop.name}} | {{rel_prop.type_annotation.representation}} | {{rel_prop.required}} |
-{% endfor %}
-{% endif %}
+        for outgoing_rel in self.outgoing_relationships:
+            section = (
+                f"{'#' * heading_level} {outgoing_rel.relationship_type}\n\n"
+                f"Target Label(s): {', '.join(outgoing_rel.target_labels)}\n"
+            )
 
-{% endfor %}
-{% endif %}
-"""
+            if outgoing_rel.properties:
+                section += f"\n{_md_properties_table(outgoing_rel.properties)}\n\n"
 
-        schema_template = Template(schema_template_raw)
+            sections.append(section)
 
-        return schema_template.render(
-            model_schema=self, heading_level=heading_level
-        ).strip()
+        return "\n\n".join(sections).strip()
 
 
 def extract_type_mapping(
     annotation: Any, show_optional: bool = True
+) -> NeontologyAnnotationData:
+    # the same annotations tend to be reused across many fields and models,
+    # so cache the result where the annotation can be used as a cache key
+    try:
+        hash(annotation)
+    except TypeError:
+        return _extract_type_mapping(annotation, show_optional)
+
+    return _extract_type_mapping_cached(annotation, show_optional)
+
+
+def _extract_type_mapping(
+    annotation: Any, show_optional: bool = True
 ) -> NeontologyAnnotationData:
     if isinstance(annotation, type):
         # we have a plain type, just return the name
@@ -102,41 +127,40 @@ def extract_type_mapping(
         )
 
     elif get_origin(annotation) == Union:
+        args = get_args(annotation)
+
         # We can only support union's of a single type plus none (i.e. Optional)
-        if len(get_args(annotation)) == 2 and type(None) in get_args(annotation):
+        if len(args) == 2 and type(None) in args:
             # we need to extract the optional type
-            for entry in get_args(annotation):
-                if isinstance(entry, type(None)):
-                    pass
-                else:
-                    # we do this recursively in case the next layer down is something like List[int]
-                    if show_optional is True:
-                        representation = (
-                            f"Optional[{extract_type_mapping(entry).representation}]"
-                        )
-                        core_type = extract_type_mapping(entry).core_type
-                        return NeontologyAnnotationData(
-                            optional=True,
-                            representation=representation,
-                            core_type=core_type,
-                        )
-                    else:
-                        return extract_type_mapping(entry)
-                raise TypeError(f"Unsupported type annotation: {annotation}")
+            entry = args[0] if args[1] is type(None) else args[1]
+
+            # we do this recursively in case the next layer down is something like List[int]
+            if show_optional is True:
+                inner = extract_type_mapping(entry)
+                return NeontologyAnnotationData(
+                    optional=True,
+                    representation=f"Optional[{inner.representation}]",
+                    core_type=inner.core_type,
+                )
+            else:
+                return extract_type_mapping(entry)
         else:
             raise TypeError(f"Unsupported union type: {annotation}")
 
     elif get_origin(annotation) == list:
-        if len(get_args(annotation)) == 1:
+        args = get_args(annotation)
+
+        if len(args) == 1:
+            # works the same for typing.List[x] and list[x]
+            # and recursively handles entries like List[Optional[int]]
             try:
-                # field type is something like typing.List[str]
-                representation = str(annotation).split(".")[1]
+                inner_representation = extract_type_mapping(args[0]).representation
+
+            except (AttributeError, TypeError):
+                inner_representation = str(args[0]).replace("typing.", "")
 
-            except IndexError:
-                # some Python versions support just list[x]
-                representation = str(annotation).title()
             return NeontologyAnnotationData(
-                representation=representation,
+                representation=f"List[{inner_representation}]",
                 core_type=annotation,
             )
         else:
@@ -146,3 +170,62 @@ def extract_type_mapping(
     return NeontologyAnnotationData(
         representation=str(annotation.__name__), core_type=annotation
     )
+
+
+_extract_type_mapping_cached = functools.lru_cache(maxsize=None)(_extract_type_mapping)
+
+
+def get_schema_properties(
+    model_class: Type[BaseModel], exclude: FrozenSet[str] = frozenset()
+) -> Tuple[SchemaProperty, ...]:
+    """Get the schema properties for a model's fields.
+
+    Required fields come first (most recently defined first), then optional fields.
+    Results are cached until the model is rebuilt or new types are defined.
+
+    Args:
+        model_class (Type[BaseModel]): the node or relationship class.
+        exclude (FrozenSet[str], optional): field names to leave out.
+            Defaults to frozenset().
+
+    Returns:
+        Tuple[SchemaProperty, ...]: the schema properties.
+    """
+
+    # pydantic replaces the validator whenever a model is rebuilt
+    # (e.g. once forward references are resolved) so include it in the cache key
+    return _get_schema_properties(
+        model_class, model_class.__pydantic_validator__, exclude
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_schema_properties(
+    model_class: Type[BaseModel], validator: Any, exclude: FrozenSet[str]
+) -> Tuple[SchemaProperty, ...]:
+
+    required_properties = []
+    optional_properties = []
+
+    for field_name, field_props in model_class.model_fields.items():
+        if field_name in exclude:
+            continue
+
+        field_type = extract_type_mapping(field_props.annotation, show_optional=True)
+
+        required_field = field_props.is_required()
+
+        schema_property = SchemaProperty(
+            type_annotation=field_type,
+            name=field_name,
+            required=required_field,
+        )
+
+        if required_field is True:
+            required_properties.append(schema_property)
+
+        # put optional fields at the end
+        else:
+            optional_properties.append(schema_property)
+
+    return tuple(required_properties[::-1] + optional_properties)
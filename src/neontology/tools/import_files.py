@@ -1,7 +1,8 @@
+import itertools
 import json
 from logging import getLogger
 from pathlib import Path
-from typing import Generator, List, Optional, Sequence
+from typing import Generator, Iterable, Iterator, Optional
 
 import yaml
 
@@ -9,20 +10,34 @@ from .import_records import import_records
 
 logger = getLogger(__name__)
 
+# prefer the libyaml backed loader where it's available
+_YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-def _identify_filepaths(input_path: str, path_pattern: str) -> List[Path]:
+
+def _identify_filepaths(input_path: str, path_pattern: str) -> Iterator[Path]:
     path = Path(input_path)
 
     if path.is_file():
-        return [path]
+        return iter([path])
+
+    # glob lazily so that we can start processing files as they're found
+    return path.glob(path_pattern)
 
-    return list(path.glob(path_pattern))
 
+def _batch(iterable: Iterable, batch_size: Optional[int] = None) -> Generator:
+    iterator = iter(iterable)
+
+    # without a batch size, process everything in one go
+    if not batch_size:
+        full_batch = list(iterator)
+
+        if full_batch:
+            yield full_batch
+
+        return
 
-def _batch(iterable: Sequence, batch_size: int = 1) -> Generator:
-    full_length = len(iterable)
-    for ndx in range(0, full_length, batch_size):
-        yield iterable[ndx : min(ndx + batch_size, full_length)]  # noqa: E203
+    while batch := list(itertools.islice(iterator, batch_size)):
+        yield batch
 
 
 def import_json(
@@ -35,14 +50,11 @@ def import_json(
 ) -> None:
     file_paths = _identify_filepaths(path, path_pattern)
 
-    if len(file_paths) == 0:
-        logger.warning("Didn't find any files to import")
-        return
-
-    if not batch_size:
-        batch_size = len(file_paths)
+    found_files = False
 
     for file_batch in _batch(file_paths, batch_size):
+        found_files = True
+
         input_records = []
 
         for file_path in file_batch:
@@ -59,6 +71,9 @@ def import_json(
             validate_only=validate_only,
         )
 
+    if found_files is False:
+        logger.warning("Didn't find any files to import")
+
 
 def import_yaml(
     path: str,
@@ -70,14 +85,11 @@ def import_yaml(
 ) -> None:
     file_paths = _identify_filepaths(path, path_pattern)
 
-    if len(file_paths) == 0:
-        logger.warning("Didn't find any files to import")
-        return
-
-    if batch_size is None:
-        batch_size = len(file_paths)
+    found_files = False
 
     for file_batch in _batch(file_paths, batch_size):
+        found_files = True
+
         input_records = []
 
         for file_path in file_batch:
@@ -94,6 +106,9 @@ def import_yaml(
             validate_only=validate_only,
         )
 
+    if found_files is False:
+        logger.warning("Didn't find any files to import")
+
 
 def import_md(
     path: str,
@@ -105,14 +120,11 @@ def import_md(
 ) -> None:
     file_paths = _identify_filepaths(path, path_pattern)
 
-    if len(file_paths) == 0:
-        logger.warning("Didn't find any files to import")
-        return
-
-    if not batch_size:
-        batch_size = len(file_paths)
+    found_files = False
 
     for file_batch in _batch(file_paths, batch_size):
+        found_files = True
+
         input_records = []
 
         for file_path in file_batch:
@@ -121,12 +133,14 @@ def import_md(
             with open(file_path, "r") as md_file:
                 raw_entry = md_file.read()
 
-            entry = raw_entry.strip().split("---", maxsplit=2)
+            # any leading whitespace ends up in the (discarded) first entry,
+            # so there's no need to strip a copy of the whole file first
+            entry = raw_entry.split("---", maxsplit=2)
 
             frontmatter = entry[1]
             markdown_text = entry[2].strip()
 
-            record = next(yaml.safe_load_all(frontmatter))
+            record = yaml.load(frontmatter, Loader=_YamlSafeLoader)
             body_property = record.pop("BODY_PROPERTY")
 
             record[body_property] = markdown_text
@@ -139,3 +153,6 @@ def import_md(
             error_on_unmatched=error_on_unmatched,
             validate_only=validate_only,
         )
+
+    if found_files is False:
+        logger.warning("Didn't find any files to import")
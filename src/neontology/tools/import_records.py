@@ -1,22 +1,50 @@
+import functools
 import logging
 from collections import defaultdict
-from copy import deepcopy
-from typing import Any, Dict, List, Optional, Tuple, Union
-
-from pydantic import BaseModel, model_validator
+from dataclasses import dataclass, replace
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from pydantic import BaseModel
 
 from ..gql import gql_identifier_adapter
 from ..graphconnection import GraphConnection
 from ..utils import get_node_types, get_rels_by_type
 
+if TYPE_CHECKING:
+    from ..basenode import BaseNode
+
 logger = logging.getLogger(__name__)
 
+# maximum number of records merged in a single call, to keep transactions small
+MERGE_BATCH_SIZE = 1000
 
-def nested_dict(n, type):
-    if n == 1:
-        return defaultdict(type)
-    else:
-        return defaultdict(lambda: nested_dict(n - 1, type))
+
+# keys which control how a record is imported rather than being properties
+_NODE_RESERVED_KEYS = frozenset({"LABEL"})
+
+_REL_RESERVED_KEYS = frozenset(
+    {
+        "SOURCE_LABEL",
+        "TARGET_LABEL",
+        "TARGET_PROPERTY",
+        "RELATIONSHIP_TYPE",
+        "TARGET_NODES",
+        "TARGETS",
+    }
+)
+
+_REL_NON_PROPERTY_KEYS = _REL_RESERVED_KEYS | {"source", "target"}
 
 
 class NeontologyNodeRaw(BaseModel):
@@ -25,205 +53,266 @@ class NeontologyNodeRaw(BaseModel):
 
 class NeontologyRelationshipRaw(BaseModel):
     RELATIONSHIP_TYPE: str
+    SOURCE_LABEL: str
     TARGET_LABEL: str
     TARGET_NODES: Optional[List[NeontologyNodeRaw]] = None
     TARGETS: Optional[List[str]] = None
     TARGET_PROPERTY: Optional[str] = None
 
 
-class NeontologyNodeRecord(BaseModel):
-    input_record: NeontologyNodeRaw
-    label: str
-    output_record: dict
-
-    @model_validator(mode="before")
-    def populate_node_fields(cls, data):
-        if not data.get("label"):
-            data["label"] = data.get("input_record", {}).get("LABEL")
-
-        if not data.get("output_record"):
-            data["output_record"] = {
-                k: v
-                for k, v in data.get("input_record", {}).items()
-                if k not in ["LABEL"]
-            }
-
-        return data
+# __slots__ is declared by hand as dataclass(slots=True) requires python 3.10
+@dataclass
+class NeontologyNodeRecord:
+    __slots__ = ("input_record", "label", "output_record")
 
-
-class NeontologyRelationshipRecord(BaseModel):
-    input_record: NeontologyRelationshipRaw
+    input_record: Dict[str, Any]
+    label: str
+    output_record: Dict[str, Any]
+
+    @classmethod
+    def from_input_record(cls, input_record: Dict[str, Any]) -> "NeontologyNodeRecord":
+        raw = NeontologyNodeRaw.model_validate(input_record)
+
+        output_record = {
+            k: v for k, v in input_record.items() if k not in _NODE_RESERVED_KEYS
+        }
+
+        return cls(
+            input_record=input_record, label=raw.LABEL, output_record=output_record
+        )
+
+
+@dataclass
+class NeontologyRelationshipRecord:
+    __slots__ = (
+        "input_record",
+        "relationship_type",
+        "target_prop",
+        "source_label",
+        "target_label",
+        "source",
+        "target",
+        "relationship_properties",
+        "output_record",
+    )
+
+    input_record: Dict[str, Any]
     relationship_type: str
-    target_prop: Optional[str] = None
+    target_prop: Optional[str]
     source_label: str
     target_label: str
     source: Any
     target: Any
-    relationship_properties: dict
-    output_record: dict
-
-    @model_validator(mode="before")
-    def populate_rel_fields(cls, data):
-        if not data.get("RELATIONSHIP_TYPE"):
-            data["relationship_type"] = data.get("input_record", {}).get(
-                "RELATIONSHIP_TYPE"
+    relationship_properties: Dict[str, Any]
+    output_record: Dict[str, Any]
+
+    @classmethod
+    def from_input_record(
+        cls,
+        input_record: Dict[str, Any],
+        node_types: Optional[Dict[str, Type["BaseNode"]]] = None,
+    ) -> "NeontologyRelationshipRecord":
+        raw = NeontologyRelationshipRaw.model_validate(input_record)
+
+        if node_types is None:
+            node_types = get_node_types()
+
+        # relationships are always matched on the target's primary property
+        target_prop = node_types[raw.TARGET_LABEL].__primaryproperty__
+
+        output_record = {
+            k: v for k, v in input_record.items() if k not in _REL_RESERVED_KEYS
+        }
+
+        relationship_properties = {
+            k: v for k, v in input_record.items() if k not in _REL_NON_PROPERTY_KEYS
+        }
+
+        return cls(
+            input_record=input_record,
+            relationship_type=raw.RELATIONSHIP_TYPE,
+            target_prop=target_prop,
+            source_label=raw.SOURCE_LABEL,
+            target_label=raw.TARGET_LABEL,
+            source=input_record.get("source"),
+            target=input_record.get("target"),
+            relationship_properties=relationship_properties,
+            output_record=output_record,
+        )
+
+    @classmethod
+    def from_shared(
+        cls,
+        base_record: Dict[str, Any],
+        targets: List[Any],
+        node_types: Optional[Dict[str, Type["BaseNode"]]] = None,
+    ) -> List["NeontologyRelationshipRecord"]:
+        if not targets:
+            return []
+
+        # validate and strip the shared fields once, then only vary the target
+        shared = cls.from_input_record(base_record, node_types)
+
+        return [
+            replace(
+                shared,
+                target=target,
+                output_record=dict(shared.output_record, target=target),
             )
+            for target in targets
+        ]
 
-        if not data.get("source_label"):
-            data["source_label"] = data.get("input_record", {}).get("SOURCE_LABEL")
-
-        if not data.get("target_label"):
-            data["target_label"] = data.get("input_record", {}).get("TARGET_LABEL")
-
-        if not data.get("target_prop"):
-            data["target_prop"] = data.get("input_record", {}).get("TARGET_PROPERTY")
-
-        if not data.get("source"):
-            data["source"] = data.get("input_record", {}).get("source")
-
-        if not data.get("target"):
-            data["target"] = data.get("input_record", {}).get("target")
-
-        if not data.get("relationship_properties"):
-            data["relationship_properties"] = {
-                k: v
-                for k, v in data.get("input_record", {}).items()
-                if k
-                not in [
-                    "SOURCE_LABEL",
-                    "TARGET_LABEL",
-                    "TARGET_PROPERTY",
-                    "RELATIONSHIP_TYPE",
-                    "TARGET_NODES",
-                    "TARGETS",
-                    "source",
-                    "target",
-                ]
-            }
-
-        if not data.get("output_record"):
-            data["output_record"] = {
-                k: v
-                for k, v in data.get("input_record", {}).items()
-                if k
-                not in [
-                    "SOURCE_LABEL",
-                    "TARGET_LABEL",
-                    "TARGET_PROPERTY",
-                    "RELATIONSHIP_TYPE",
-                    "TARGET_NODES",
-                    "TARGETS",
-                ]
-            }
-
-        return data
-
-    @model_validator(mode="after")
-    def populate_fields(self):
-        node_types = get_node_types()
-        self.target_prop = node_types[self.target_label].__primaryproperty__
-
-        return self
-
-
-def _import_nodes(input_records: List[NeontologyNodeRecord]):
-    mapped_records = defaultdict(list)
-    node_types = get_node_types()
 
-    for record in input_records:
-        mapped_records[record.label].append(record.output_record)
+# relationship records are grouped by type, target prop, source and target labels
+_RelGroupKey = Tuple[str, str, str, str]
+_NodeBuckets = Dict[str, List[Dict[str, Any]]]
+_RelBuckets = Dict[_RelGroupKey, List[NeontologyRelationshipRecord]]
 
-    for label, node_records in mapped_records.items():
-        node_class = node_types[label]
-        node_class.merge_records(node_records)
 
+def _chunks(records: List[Any], batch_size: int) -> Iterator[List[Any]]:
+    for i in range(0, len(records), batch_size):
+        yield records[i : i + batch_size]  # noqa: E203
 
-def _import_relationships(
-    input_records: List[NeontologyRelationshipRecord],
-    check_unmatched: bool,
-    error_on_unmatched: bool,
-):
-    # if we're meant to warn on unmatched, we need to look up source and target
 
-    mapped_records = nested_dict(4, list)
-    rel_types = get_rels_by_type()
+def _import_nodes(node_buckets: _NodeBuckets) -> None:
     node_types = get_node_types()
 
-    for record in input_records:
-        rel_type = record.relationship_type
+    for label, node_records in node_buckets.items():
+        node_class = node_types[label]
+
+        for node_batch in _chunks(node_records, MERGE_BATCH_SIZE):
+            node_class.merge_records(node_batch)
+
+
+@functools.lru_cache(maxsize=256)
+def _unmatched_check_cypher(target_label: str, target_prop: str) -> str:
+    gql_identifier_adapter.validate_strings(target_label)
+    gql_identifier_adapter.validate_strings(target_prop)
+
+    # check all the targets for a group in a single query
+    # and only return the positions of the ones which didn't match exactly one node
+    return f"""
+        UNWIND range(0, size($vals) - 1) AS idx
+        WITH idx, $vals[idx] AS val
+        OPTIONAL MATCH (n:{target_label})
+        WHERE n.{target_prop} = val
+        WITH idx, COUNT(n) AS matches
+        WHERE matches <> 1
+        RETURN COLLECT({{idx: idx, matches: matches}})
+        """
+
+
+def _target_key(value: Any) -> Any:
+    # key on type as well, so values like 1 and True are checked separately
+    # unhashable targets (e.g. lists from JSON input) are keyed on their repr
+    try:
+        hash(value)
+    except TypeError:
+        return (type(value), repr(value))
+
+    return (type(value), value)
+
+
+def _check_unmatched(
+    gc: GraphConnection,
+    rel_type: str,
+    target_label: str,
+    target_prop: str,
+    rel_entries: List[NeontologyRelationshipRecord],
+    error_on_unmatched: bool,
+) -> None:
+    cypher = _unmatched_check_cypher(target_label, target_prop)
+
+    # only look up each distinct target once
+    target_vals: Dict[Any, Any] = {}
+
+    for rel_entry in rel_entries:
+        target_vals.setdefault(_target_key(rel_entry.target), rel_entry.target)
+
+    target_keys = list(target_vals)
+
+    params = {"vals": list(target_vals.values())}
+
+    # results refer to targets by position
+    # as values don't always round trip through the database unchanged
+    unmatched = {
+        target_keys[entry["idx"]]: entry["matches"]
+        for entry in gc.evaluate_query_single(cypher, params) or []
+    }
+
+    if not unmatched:
+        return
+
+    # but still report every relationship which doesn't match
+    for rel_entry in rel_entries:
+        matches = unmatched.get(_target_key(rel_entry.target))
 
-        # when we merge relationship records, we pass in target prop and source prop
-        # we also need to hydrate based on the given source and target labels
-        # therefore we need to group together records which share those properties
-        mapped_records[rel_type][record.target_prop][record.source_label][
-            record.target_label
-        ].append(record)
+        if matches is None:
+            continue
 
-    for rel_type, rel_records_by_prop in mapped_records.items():
-        for target_prop, rel_records_by_source_label in rel_records_by_prop.items():
-            for (
-                source_label,
-                rel_records_by_target_label,
-            ) in rel_records_by_source_label.items():
-                for target_label, rel_entries in rel_records_by_target_label.items():
-                    if check_unmatched is True:
-                        for rel_entry in rel_entries:
-                            gc = GraphConnection()
+        if matches > 1:
+            message = (
+                f"Matched {matches} on {rel_type} for {target_label}"
+                f" WHERE {target_prop} = {rel_entry.target}"
+            )
 
-                            gql_identifier_adapter.validate_strings(target_label)
-                            gql_identifier_adapter.validate_strings(target_prop)
+            if error_on_unmatched is True:
+                raise ValueError(message)
 
-                            cypher = f"""
-                                MATCH (n:{target_label})
-                                WHERE n.{target_prop} = $val
-                                RETURN n
-                                """
+            logger.warning(message)
 
-                            params = {"val": rel_entry.target}
+        else:
+            error_msg = f"No target node for {rel_type} to {rel_entry.target}"
 
-                            result = gc.evaluate_query(cypher, params)
+            if error_on_unmatched is True:
+                raise ValueError(error_msg)
 
-                            if len(result.nodes) > 1:
-                                message = (
-                                    f"Matched {len(result.nodes)} on {rel_type} for {target_label}"
-                                    f" WHERE {target_prop} = {rel_entry.target}"
-                                )
+            logger.warning(error_msg)
 
-                                if error_on_unmatched is True:
-                                    raise ValueError(message)
 
-                                logger.warning(message)
+def _import_relationships(
+    rel_buckets: _RelBuckets,
+    check_unmatched: bool,
+    error_on_unmatched: bool,
+) -> None:
+    rel_types = get_rels_by_type()
+    node_types = get_node_types()
 
-                            elif len(result.nodes) == 0:
-                                error_msg = f"No target node for {rel_type} to {rel_entry.target}"
+    # if we're meant to warn on unmatched, we need to look up source and target
+    if check_unmatched is True:
+        gc = GraphConnection()
 
-                                if error_on_unmatched is True:
-                                    raise ValueError(error_msg)
+    for group_key, rel_entries in rel_buckets.items():
+        rel_type, target_prop, source_label, target_label = group_key
 
-                                logger.warning(error_msg)
+        if check_unmatched is True:
+            _check_unmatched(
+                gc, rel_type, target_label, target_prop, rel_entries, error_on_unmatched
+            )
 
-                    source_type = node_types[source_label]
-                    target_type = node_types[target_label]
+        source_type = node_types[source_label]
+        target_type = node_types[target_label]
 
-                    rel_class = rel_types[rel_type].relationship_class
+        rel_class = rel_types[rel_type].relationship_class
 
-                    output_records = [x.output_record for x in rel_entries]
+        output_records = [x.output_record for x in rel_entries]
 
-                    rel_class.merge_records(
-                        output_records,
-                        source_type=source_type,
-                        target_type=target_type,
-                        target_prop=target_prop,
-                    )
+        for rel_batch in _chunks(output_records, MERGE_BATCH_SIZE):
+            rel_class.merge_records(
+                rel_batch,
+                source_type=source_type,
+                target_type=target_type,
+                target_prop=target_prop,
+            )
 
 
 def _process_sub_records(
-    source_node_record: NeontologyNodeRecord, subrecords
-) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    source_node_record: NeontologyNodeRecord, subrecords: List[Dict[str, Any]]
+) -> Tuple[List[NeontologyNodeRecord], List[NeontologyRelationshipRecord]]:
     node_types = get_node_types()
 
-    output_nodes = []
-    output_rels = []
+    output_nodes: List[NeontologyNodeRecord] = []
+    output_rels: List[NeontologyRelationshipRecord] = []
 
     # hydrate the source node to get the pp
     # then dump it
@@ -246,28 +335,25 @@ def _process_sub_records(
         # then dump them
         if "TARGET_NODES" in record:
             for entry in record["TARGET_NODES"]:
-                target_node_record = NeontologyNodeRecord(input_record=entry)
+                target_node_record = NeontologyNodeRecord.from_input_record(entry)
                 tgt_node = target_class(**target_node_record.output_record)
                 rel_targets.append(tgt_node.get_pp())
                 output_nodes.append(target_node_record)
 
         if "TARGETS" in record:
-            rel_targets += record["TARGETS"]
+            rel_targets.extend(record["TARGETS"])
 
         # now do the relationships
         # convert to neontology style
-        rel_dict = record
-        rel_dict["source"] = source_node_pk
-        rel_dict["SOURCE_LABEL"] = source_label
+        # build a new dict rather than mutating the caller's record
+        rel_dict = {**record, "source": source_node_pk, "SOURCE_LABEL": source_label}
 
         if target_prop:
             rel_dict["TARGET_PROPERTY"] = target_prop
 
-        output_raw_records = [{**rel_dict, **{"target": x}} for x in rel_targets]
-
-        output_rels += [
-            NeontologyRelationshipRecord(input_record=x) for x in output_raw_records
-        ]
+        output_rels.extend(
+            NeontologyRelationshipRecord.from_shared(rel_dict, rel_targets, node_types)
+        )
 
     # returns a set of records to be used as input to import_records
     return output_nodes, output_rels
@@ -276,8 +362,6 @@ def _process_sub_records(
 def _prepare_records(
     input_records: Union[List[Dict[str, Any]], Dict[str, Any]],
 ) -> tuple:
-    input_records = input_records.copy()
-
     if isinstance(input_records, dict):
         # handle the situation where we've just been passed a single record
         if "nodes" not in input_records and "edges" not in input_records:
@@ -286,41 +370,46 @@ def _prepare_records(
         # handle the situation where we've got 'link data'
         # which consists of node records and link/relationship records
         else:
-            raw_records = input_records.get("nodes", [])
-            raw_records += input_records.get("edges", [])
+            raw_records = [
+                *input_records.get("nodes", []),
+                *input_records.get("edges", []),
+            ]
 
     else:
-        raw_records = input_records.copy()
+        raw_records = input_records
 
     input_nodes = []
     input_relationships = []
+    has_sub_records = False
+
+    node_types = get_node_types()
 
     for record in raw_records:
         if "LABEL" in record.keys():
             # pull out relationships
             # append the input_node
             # now parse the relationships
-            rel_records = record.pop("RELATIONSHIPS_OUT", None)
+            rel_records = None
 
-            node_record = NeontologyNodeRecord(input_record=record)
+            if "RELATIONSHIPS_OUT" in record:
+                # shallow copy so we don't modify the caller's record
+                record = dict(record)
+                rel_records = record.pop("RELATIONSHIPS_OUT")
+
+            node_record = NeontologyNodeRecord.from_input_record(record)
 
             input_nodes.append(node_record)
 
             if rel_records:
-                logger.warning(
-                    (
-                        "Importing relationships which are sub-records to a Node. "
-                        "Note that this requires associated nodes to have explicit or deterministic primary keys."
-                    )
-                )
+                has_sub_records = True
 
                 new_nodes, new_rels = _process_sub_records(node_record, rel_records)
-                input_nodes += new_nodes
-                input_relationships += new_rels
+                input_nodes.extend(new_nodes)
+                input_relationships.extend(new_rels)
 
         elif "RELATIONSHIP_TYPE" in record.keys():
             input_relationships.append(
-                NeontologyRelationshipRecord(input_record=record)
+                NeontologyRelationshipRecord.from_input_record(record, node_types)
             )
 
         else:
@@ -332,7 +421,36 @@ def _prepare_records(
                 )
             )
 
-    return input_nodes, input_relationships
+    return input_nodes, input_relationships, has_sub_records
+
+
+def _bucket_records(
+    prepared: Iterable[tuple],
+) -> Tuple[_NodeBuckets, _RelBuckets, bool]:
+    node_buckets: _NodeBuckets = defaultdict(list)
+    rel_buckets: _RelBuckets = defaultdict(list)
+    any_sub_records = False
+
+    for prepared_nodes, prepared_rels, has_sub_records in prepared:
+        any_sub_records = any_sub_records or has_sub_records
+
+        for node_record in prepared_nodes:
+            node_buckets[node_record.label].append(node_record.output_record)
+
+        for rel_record in prepared_rels:
+            # when we merge relationship records, we pass in target prop
+            # we also need to hydrate based on the given source and target labels
+            # therefore we group together records which share those properties
+            group_key = (
+                rel_record.relationship_type,
+                rel_record.target_prop,
+                rel_record.source_label,
+                rel_record.target_label,
+            )
+
+            rel_buckets[group_key].append(rel_record)
+
+    return node_buckets, rel_buckets, any_sub_records
 
 
 def import_records(
@@ -341,17 +459,21 @@ def import_records(
     check_unmatched: bool = True,
     error_on_unmatched: bool = False,
 ) -> None:
-    input_nodes = []
-    input_rels = []
-
-    fresh_records = deepcopy(records)
-
-    for entry in fresh_records:
-        prepared_nodes, prepared_rels = _prepare_records(entry)
-
-        input_nodes += prepared_nodes
-        input_rels += prepared_rels
+    # records are grouped as each entry is prepared
+    # so we never hold a separate flat list of every prepared record
+    node_buckets, rel_buckets, has_sub_records = _bucket_records(
+        map(_prepare_records, records)
+    )
+
+    # warn once per import rather than for every node with sub-records
+    if has_sub_records:
+        logger.warning(
+            (
+                "Importing relationships which are sub-records to a Node. "
+                "Note that this requires associated nodes to have explicit or deterministic primary keys."
+            )
+        )
 
     if validate_only is False:
-        _import_nodes(input_nodes)
-        _import_relationships(input_rels, check_unmatched, error_on_unmatched)
+        _import_nodes(node_buckets)
+        _import_relationships(rel_buckets, check_unmatched, error_on_unmatched)
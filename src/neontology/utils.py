@@ -1,47 +1,75 @@
 from __future__ import annotations
 
+import functools
 from collections import defaultdict
-from typing import Dict, List, Set, Type
+from typing import Dict, FrozenSet, List, Set, Type, cast
 
 from .basenode import BaseNode
 from .baserelationship import BaseRelationship, RelationshipTypeData
 from .graphconnection import GraphConnection
+from .schema_utils import _extract_type_mapping_cached, _get_schema_properties
 
 
 def get_node_types(base_type: Type[BaseNode] = BaseNode) -> Dict[str, Type[BaseNode]]:
+    # return a copy so that callers can't modify the cached mapping
+    return dict(_get_node_types(base_type))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_node_types(base_type: Type[BaseNode]) -> Dict[str, Type[BaseNode]]:
     node_types = {}
 
-    # if we're starting with a node type that has a primary label, include this in results
-    if (
-        hasattr(base_type, "__primarylabel__")
-        and base_type.__primarylabel__ is not None
-    ):
-        node_types[base_type.__primarylabel__] = base_type
+    # walk the hierarchy depth first, in definition order
+    # so where labels are reused, the most deeply nested/last defined class wins
+    # classes with several parents are only visited once
+    to_visit = [base_type]
+    visited = set()
+
+    while to_visit:
+        node_type = to_visit.pop()
+
+        if node_type in visited:
+            continue
+
+        visited.add(node_type)
 
-    for subclass in base_type.__subclasses__():
         # we can define 'abstract' nodes which don't have a label
         # these are to provide common properties to be used by subclassed nodes
         # but shouldn't be put in the graph
-        if (
-            hasattr(subclass, "__primarylabel__")
-            and subclass.__primarylabel__ is not None
-        ):
-            node_types[subclass.__primarylabel__] = subclass
+        node_label = getattr(node_type, "__primarylabel__", None)
 
-        if subclass.__subclasses__():
-            subclass_node_types = get_node_types(subclass)
+        if node_label is not None:
+            node_types[node_label] = node_type
 
-            node_types.update(subclass_node_types)
+        to_visit.extend(reversed(node_type.__subclasses__()))
 
     return node_types
 
 
-def generate_relationship_type_data(rel_class: Type[BaseRelationship]):
-    defined_source_class = rel_class.model_fields["source"].annotation
-    defined_target_class = rel_class.model_fields["target"].annotation
+def _concrete_node_classes(node_class: Type[BaseNode]) -> List[Type[BaseNode]]:
+    # a labelled node type with no subclasses is the only concrete class
+    if (
+        getattr(node_class, "__primarylabel__", None) is not None
+        and not node_class.__subclasses__()
+    ):
+        return [node_class]
+
+    return list(_get_node_types(node_class).values())
+
 
-    all_source_classes = list(get_node_types(defined_source_class).values())
-    all_target_classes = list(get_node_types(defined_target_class).values())
+def generate_relationship_type_data(
+    rel_class: Type[BaseRelationship],
+) -> RelationshipTypeData:
+    # source and target are always annotated with node classes
+    defined_source_class = cast(
+        Type[BaseNode], rel_class.model_fields["source"].annotation
+    )
+    defined_target_class = cast(
+        Type[BaseNode], rel_class.model_fields["target"].annotation
+    )
+
+    all_source_classes = _concrete_node_classes(defined_source_class)
+    all_target_classes = _concrete_node_classes(defined_target_class)
 
     return RelationshipTypeData(
         relationship_class=rel_class,
@@ -55,46 +83,107 @@ def generate_relationship_type_data(rel_class: Type[BaseRelationship]):
 def get_rels_by_type(
     base_type: Type[BaseRelationship] = BaseRelationship,
 ) -> Dict[str, RelationshipTypeData]:
-    rel_types: dict = defaultdict(dict)
+    # return a copy so that callers can't modify the cached mapping
+    return dict(_get_rels_by_type(base_type))
 
-    if (
-        hasattr(base_type, "__relationshiptype__")
-        and base_type.__relationshiptype__ is not None
-    ):
-        rel_types[base_type.__relationshiptype__] = generate_relationship_type_data(
-            base_type
-        )
 
-    for rel_subclass in base_type.__subclasses__():
+@functools.lru_cache(maxsize=None)
+def _get_rels_by_type(
+    base_type: Type[BaseRelationship],
+) -> Dict[str, RelationshipTypeData]:
+    rel_types: Dict[str, RelationshipTypeData] = {}
+
+    # walk the hierarchy depth first, in definition order
+    # classes with several parents are only visited once
+    to_visit = [base_type]
+    visited = set()
+
+    while to_visit:
+        rel_class = to_visit.pop()
+
+        if rel_class in visited:
+            continue
+
+        visited.add(rel_class)
+
         # we can define 'abstract' relationships which don't have a label
         # these are to provide common properties to be used by subclassed relationships
         # but shouldn't be put in the graph
+        rel_type = getattr(rel_class, "__relationshiptype__", None)
 
-        if (
-            hasattr(rel_subclass, "__relationshiptype__")
-            and rel_subclass.__relationshiptype__ is not None
-        ):
-            rel_types[rel_subclass.__relationshiptype__] = (
-                generate_relationship_type_data(rel_subclass)
-            )
-
-        if rel_subclass.__subclasses__():
-            subclass_rel_types = get_rels_by_type(rel_subclass)
+        if rel_type is not None:
+            rel_types[rel_type] = generate_relationship_type_data(rel_class)
 
-            rel_types.update(subclass_rel_types)
+        to_visit.extend(reversed(rel_class.__subclasses__()))
 
     return rel_types
 
 
+def _clear_type_caches() -> None:
+    """Invalidate cached node and relationship type lookups.
+
+    Called whenever a new node or relationship class is defined.
+    Relationship type data includes the concrete source and target node classes,
+    so all the caches are cleared together, along with cached schema properties.
+    """
+
+    _get_node_types.cache_clear()
+    _get_rels_by_type.cache_clear()
+    _all_subclasses.cache_clear()
+    _node_labels.cache_clear()
+    _get_rels_by_node.cache_clear()
+    _get_schema_properties.cache_clear()
+    _extract_type_mapping_cached.cache_clear()
+
+
 def all_subclasses(cls: type) -> set:
-    return set(cls.__subclasses__()).union(
-        [s for c in cls.__subclasses__() for s in all_subclasses(c)]
-    )
+    found: Set[type] = set()
+    to_visit: List[type] = [cls]
+    subclass: type
+
+    while to_visit:
+        for subclass in to_visit.pop().__subclasses__():
+            if subclass not in found:
+                found.add(subclass)
+                to_visit.append(subclass)
+
+    return found
+
+
+# cached results are only invalidated when new node or relationship types are defined
+# so this should only be used for neontology node and relationship classes
+@functools.lru_cache(maxsize=None)
+def _all_subclasses(cls: type) -> FrozenSet[type]:
+    return frozenset(all_subclasses(cls))
+
+
+@functools.lru_cache(maxsize=None)
+def _node_labels(node_class: type) -> FrozenSet[str]:
+    # primary labels of a node class and all its subclasses
+    # shared endpoint classes are only expanded once
+    labels = set()
+
+    for candidate in (node_class, *_all_subclasses(node_class)):
+        node_label = getattr(candidate, "__primarylabel__", None)
+
+        if node_label is not None:
+            labels.add(node_label)
+
+    return frozenset(labels)
 
 
 def get_rels_by_node(
     base_type: Type[BaseRelationship] = BaseRelationship, by_source: bool = True
-) -> Dict[str, Set[str]]:
+) -> Dict[str, FrozenSet[str]]:
+    # return a copy so that callers can't modify the cached mapping
+    # the relationship type sets themselves are immutable so can be shared
+    return defaultdict(frozenset, _get_rels_by_node(base_type, by_source))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_rels_by_node(
+    base_type: Type[BaseRelationship], by_source: bool
+) -> Dict[str, FrozenSet[str]]:
     if by_source is True:
         node_dir = "source_class"
 
@@ -106,31 +195,21 @@ def get_rels_by_node(
     by_node: Dict[str, Set[str]] = defaultdict(set)
 
     for rel_type, entry in all_rels.items():
-        try:
-            node_label = entry.model_dump()[node_dir].__primarylabel__
-        except AttributeError:
-            node_label = None
-
-        if node_label is not None:
+        for node_label in _node_labels(getattr(entry, node_dir)):
             by_node[node_label].add(rel_type)
 
-        for node_subclass in all_subclasses(entry.model_dump()[node_dir]):
-            subclass_label = node_subclass.__primarylabel__
-            if subclass_label is not None:
-                by_node[subclass_label].add(rel_type)
-
-    return by_node
+    return {label: frozenset(rel_types) for label, rel_types in by_node.items()}
 
 
 def get_rels_by_source(
     base_type: Type[BaseRelationship] = BaseRelationship,
-) -> Dict[str, Set[str]]:
+) -> Dict[str, FrozenSet[str]]:
     return get_rels_by_node(base_type, by_source=True)
 
 
 def get_rels_by_target(
     base_type: Type[BaseRelationship] = BaseRelationship,
-) -> Dict[str, Set[str]]:
+) -> Dict[str, FrozenSet[str]]:
     return get_rels_by_node(base_type, by_source=False)
 
 
@@ -139,13 +218,17 @@ def apply_neo4j_constraints(node_types: List[type[BaseNode]]) -> None:
 
     graph = GraphConnection()
 
+    constraints = []
+
     for node_type in node_types:
         label = node_type.__primarylabel__
         if not label:
             raise ValueError(
                 "Node must have an explicit primary label to apply a constraint."
             )
-        graph.engine.apply_constraint(label, node_type.__primaryproperty__)
+        constraints.append((label, node_type.__primaryproperty__))
+
+    graph.engine.apply_constraints(constraints)
 
 
 def auto_constrain_neo4j() -> None:
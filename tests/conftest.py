@@ -22,40 +22,61 @@ def reset_constraints():
     except NotImplementedError:
         return
 
-    for constraint_name in constraints:
-        gc.engine.drop_constraint(constraint_name)
+    gc.engine.drop_constraints(constraints)
 
 
-@pytest.fixture(
-    scope="session",
-    params=[
-        pytest.param(
-            {
-                "graph_config_vars": {
-                    "uri": "TEST_NEO4J_URI",
-                    "username": "TEST_NEO4J_USERNAME",
-                    "password": "TEST_NEO4J_PASSWORD",
-                },
-                "graph_engine": "NEO4J",
+# load environment variables once, before the engine params are built
+load_dotenv()
+
+GRAPH_CONFIGS = [
+    (
+        {
+            "graph_config_vars": {
+                "uri": "TEST_NEO4J_URI",
+                "username": "TEST_NEO4J_USERNAME",
+                "password": "TEST_NEO4J_PASSWORD",
             },
-            id="neo4j-engine",
-        ),
-        pytest.param(
-            {
-                "graph_config_vars": {
-                    "uri": "TEST_MEMGRAPH_URI",
-                    "username": "TEST_MEMGRAPH_USER",
-                    "password": "TEST_MEMGRAPH_PASSWORD",
-                },
-                "graph_engine": "MEMGRAPH",
+            "graph_engine": "NEO4J",
+        },
+        "neo4j-engine",
+    ),
+    (
+        {
+            "graph_config_vars": {
+                "uri": "TEST_MEMGRAPH_URI",
+                "username": "TEST_MEMGRAPH_USER",
+                "password": "TEST_MEMGRAPH_PASSWORD",
             },
-            id="memgraph-engine",
-        ),
-    ],
+            "graph_engine": "MEMGRAPH",
+        },
+        "memgraph-engine",
+    ),
+]
+
+
+def graph_config_param(graph_config: dict, param_id: str):
+    """Skip engines at collection time if their environment variables aren't set"""
+    missing_vars = [
+        value
+        for value in graph_config["graph_config_vars"].values()
+        if value != "TMP FILE" and os.getenv(value) is None
+    ]
+
+    marks = []
+
+    if missing_vars:
+        marks.append(
+            pytest.mark.skip(reason=f"Missing environment variables: {missing_vars}")
+        )
+
+    return pytest.param(graph_config, id=param_id, marks=marks)
+
+
+@pytest.fixture(
+    scope="session",
+    params=[graph_config_param(*graph_config) for graph_config in GRAPH_CONFIGS],
 )
 def get_graph_config(request, tmp_path_factory) -> tuple:
-    load_dotenv()
-
     graph_engines = {
         "NEO4J": Neo4jConfig,
         "MEMGRAPH": MemgraphConfig,
@@ -75,7 +96,6 @@ def get_graph_config(request, tmp_path_factory) -> tuple:
 
         else:
             graph_config[key] = os.getenv(value)
-            assert graph_config[key] is not None
 
     graph_engine = request.param["graph_engine"]
 
@@ -88,8 +108,6 @@ def get_graph_config(request, tmp_path_factory) -> tuple:
     scope="session",
 )
 def graph_db(request, tmp_path_factory, get_graph_config):
-    load_dotenv()
-
     init_neontology(get_graph_config)
 
     gc = GraphConnection()
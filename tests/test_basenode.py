@@ -177,13 +177,14 @@ def test_none_primary_label():
         SpecialPracticeNode(pp="Test Node")
 
 
-def test_create_multilabel(use_graph):
-    class MultipleLabelNode(BaseNode):
-        __primaryproperty__: ClassVar[str] = "pp"
-        __primarylabel__: ClassVar[Optional[str]] = "PrimaryLabel"
-        __secondarylabels__: ClassVar[Optional[list]] = ["ExtraLabel1", "ExtraLabel2"]
-        pp: str
+class MultipleLabelNode(BaseNode):
+    __primaryproperty__: ClassVar[str] = "pp"
+    __primarylabel__: ClassVar[Optional[str]] = "PrimaryLabel"
+    __secondarylabels__: ClassVar[Optional[list]] = ["ExtraLabel1", "ExtraLabel2"]
+    pp: str
+
 
+def test_create_multilabel(use_graph):
     tn = MultipleLabelNode(pp="Test Node")
 
     tn.create()
@@ -205,20 +206,23 @@ def test_create_multilabel(use_graph):
     assert result.nodes[0].pp == "Test Node"
 
 
-def test_create_multilabel_inheritance(use_graph):
-    class Mammal(BaseNode):
-        __primaryproperty__: ClassVar[str] = "pp"
-        __secondarylabels__: ClassVar[Optional[list]] = ["Mammal"]
-        pp: str
+class Mammal(BaseNode):
+    __primaryproperty__: ClassVar[str] = "pp"
+    __secondarylabels__: ClassVar[Optional[list]] = ["Mammal"]
+    pp: str
+
+
+class Human(Mammal):
+    __primaryproperty__: ClassVar[str] = "pp"
+    __primarylabel__: ClassVar[Optional[str]] = "Human"
+    pp: str
 
-    class Human(Mammal):
-        __primaryproperty__: ClassVar[str] = "pp"
-        __primarylabel__: ClassVar[Optional[str]] = "Human"
-        pp: str
 
+@pytest.mark.parametrize("write_method", ["create", "merge"])
+def test_write_multilabel_inheritance(use_graph, write_method):
     tn = Human(pp="Bob")
 
-    tn.create()
+    getattr(tn, write_method)()
 
     cypher = """
     MATCH (n:Human)
@@ -275,35 +279,6 @@ def test_create_multilabel_inheritance_multiple(use_graph):
     assert result == 2
 
 
-def test_merge_defined_label_inherited(use_graph):
-    class Mammal(BaseNode):
-        __primaryproperty__: ClassVar[str] = "pp"
-        __secondarylabels__: ClassVar[Optional[list]] = ["Mammal"]
-        pp: str
-
-    class Human(Mammal):
-        __primaryproperty__: ClassVar[str] = "pp"
-        __primarylabel__: ClassVar[Optional[str]] = "Human"
-        pp: str
-
-    tn = Human(pp="Bob")
-
-    tn.merge()
-
-    cypher = """
-    MATCH (n:Human)
-    WHERE n.pp = 'Bob'
-    RETURN n
-    """
-
-    result = use_graph.evaluate_query(cypher)
-
-    assert "Human" in result.records_raw[0].values()[0].labels
-    assert "Mammal" in result.records_raw[0].values()[0].labels
-
-    assert result.nodes[0].pp == "Bob"
-
-
 class SpecialPracticeNode(BaseNode):
     __primarylabel__: ClassVar[Optional[str]] = "SpecialTestLabel1"
     __primaryproperty__: ClassVar[str] = "pp"
@@ -391,11 +366,10 @@ def test_match_nodes(use_graph):
 
 def test_match_nodes_limit(use_graph):
     tn = PracticeNode(pp="Special Test Node")
-    tn.merge()
 
     tn2 = PracticeNode(pp="Special Test Node2")
 
-    tn2.merge()
+    PracticeNode.merge_nodes([tn, tn2])
 
     results = PracticeNode.match_nodes(limit=1)
 
@@ -406,11 +380,10 @@ def test_match_nodes_limit(use_graph):
 
 def test_match_nodes_skip(use_graph):
     tn = PracticeNode(pp="Special Test Node")
-    tn.merge()
 
     tn2 = PracticeNode(pp="Special Test Node2")
 
-    tn2.merge()
+    PracticeNode.merge_nodes([tn, tn2])
 
     results1 = PracticeNode.match_nodes(limit=1)
 
@@ -447,13 +420,14 @@ def test_match_none(use_graph):
     assert result is None
 
 
-def test_match_many_none(use_graph):
-    class PracticeNode2(BaseNode):
-        __primaryproperty__: ClassVar[str] = "pp"
-        __primarylabel__: ClassVar[str] = "PracticeNode2"
+class PracticeNode2(BaseNode):
+    __primaryproperty__: ClassVar[str] = "pp"
+    __primarylabel__: ClassVar[str] = "PracticeNode2"
 
-        pp: str
+    pp: str
 
+
+def test_match_many_none(use_graph):
     bn = PracticeNode2(pp="Test Node")
     bn.create()
 
@@ -584,7 +558,7 @@ def test_property_types(use_graph, test_model, test_prop, input_value, expected_
 
     result = test_model.match(pp)
 
-    assert result.model_dump()[test_prop] == input_value
+    assert getattr(result, test_prop) == input_value
 
     cypher = f"""
     MATCH (n:{test_model.__primarylabel__})
@@ -599,37 +573,41 @@ def test_property_types(use_graph, test_model, test_prop, input_value, expected_
     assert cypher_result in expected_value
 
 
-def test_empty_list_property(use_graph):
-    class TestModelListProp(BaseNode):
-        __primaryproperty__: ClassVar[str] = "pp"
-        __primarylabel__: ClassVar[Optional[str]] = "TestModel1"
-        pp: str
-        list_prop: list
+class ModelTestListProp(BaseNode):
+    __primaryproperty__: ClassVar[str] = "pp"
+    __primarylabel__: ClassVar[Optional[str]] = "TestModel1"
+    pp: str
+    list_prop: list
+
 
+def test_empty_list_property(use_graph):
     pp = "test_node"
 
-    testmodel = TestModelListProp(list_prop=[], pp=pp)
+    testmodel = ModelTestListProp(list_prop=[], pp=pp)
 
     testmodel.create()
 
-    result = TestModelListProp.match(pp)
+    result = ModelTestListProp.match(pp)
 
     assert result.list_prop == []
 
 
+class ModelTestSetOnMatch(BaseNode):
+    __primaryproperty__: ClassVar[str] = "pp"
+    __primarylabel__: ClassVar[Optional[str]] = "TestModel2"
+    pp: str = "test_node"
+    only_set_on_match: Optional[str] = Field(
+        json_schema_extra={"set_on_match": True}, default=None
+    )
+    normal_field: str
+
+
 def test_set_on_match(use_graph):
     """Check that we successfully identify field to set on match"""
 
-    class TestModel(BaseNode):
-        __primaryproperty__: ClassVar[str] = "pp"
-        __primarylabel__: ClassVar[Optional[str]] = "TestModel2"
-        pp: str = "test_node"
-        only_set_on_match: Optional[str] = Field(
-            json_schema_extra={"set_on_match": True}, default=None
-        )
-        normal_field: str
-
-    test_node = TestModel(only_set_on_match="Foo", normal_field="Bar", pp="test_node")
+    test_node = ModelTestSetOnMatch(
+        only_set_on_match="Foo", normal_field="Bar", pp="test_node"
+    )
     test_node.merge()
 
     cypher = """
@@ -643,7 +621,9 @@ def test_set_on_match(use_graph):
     assert cypher_result.nodes[0].only_set_on_match is None
     assert cypher_result.nodes[0].normal_field == "Bar"
 
-    test_node2 = TestModel(only_set_on_match="Foo", normal_field="Bar", pp="test_node")
+    test_node2 = ModelTestSetOnMatch(
+        only_set_on_match="Foo", normal_field="Bar", pp="test_node"
+    )
     test_node2.merge()
 
     cypher_result2 = use_graph.evaluate_query(cypher)
@@ -651,17 +631,20 @@ def test_set_on_match(use_graph):
     assert cypher_result2.nodes[0].only_set_on_match == "Foo"
 
 
+class ModelTestSetOnCreate(BaseNode):
+    __primaryproperty__: ClassVar[str] = "pp"
+    __primarylabel__: ClassVar[Optional[str]] = "TestModel3"
+    pp: str = "test_node"
+    only_set_on_create: str = Field(json_schema_extra={"set_on_create": True})
+    normal_field: str
+
+
 def test_set_on_create(use_graph):
     """Check that we successfully identify field to set on match"""
 
-    class TestModel(BaseNode):
-        __primaryproperty__: ClassVar[str] = "pp"
-        __primarylabel__: ClassVar[Optional[str]] = "TestModel3"
-        pp: str = "test_node"
-        only_set_on_create: str = Field(json_schema_extra={"set_on_create": True})
-        normal_field: str
-
-    test_node = TestModel(only_set_on_create="Foo", normal_field="Bar", pp="test_node")
+    test_node = ModelTestSetOnCreate(
+        only_set_on_create="Foo", normal_field="Bar", pp="test_node"
+    )
     test_node.merge()
 
     cypher = """
@@ -675,7 +658,9 @@ def test_set_on_create(use_graph):
     assert cypher_result.nodes[0].only_set_on_create == "Foo"
     assert cypher_result.nodes[0].normal_field == "Bar"
 
-    test_node2 = TestModel(only_set_on_create="Fee", normal_field="Fi", pp="test_node")
+    test_node2 = ModelTestSetOnCreate(
+        only_set_on_create="Fee", normal_field="Fi", pp="test_node"
+    )
     test_node2.merge()
 
     cypher_result2 = use_graph.evaluate_query(cypher)
@@ -702,8 +687,9 @@ class Person(BaseNode):
         return v
 
 
-def test_merge_df_with_duplicates(use_graph):
-    people_records = [
+# merge_df doesn't modify the dataframes it's given, so they can be shared by tests
+PEOPLE_WITH_DUPLICATES_DF = pd.DataFrame.from_records(
+    [
         {"name": "arthur", "age": 70},
         {"name": "betty", "age": 65},
         {"name": "betty", "age": 65},
@@ -711,10 +697,11 @@ def test_merge_df_with_duplicates(use_graph):
         {"name": "betty", "age": 75},
         {"name": "arthur", "age": 70},
     ]
+)
 
-    people_df = pd.DataFrame.from_records(people_records)
 
-    results = Person.merge_df(people_df)
+def test_merge_df_with_duplicates(use_graph):
+    results = Person.merge_df(PEOPLE_WITH_DUPLICATES_DF)
 
     names = [x.name for x in results]
 
@@ -740,17 +727,18 @@ class Person2(BaseNode):
     favorite_colors: Optional[list] = None
 
 
-def test_merge_df_with_lists(use_graph):
-    people_records = [
-        {"name": "arthur", "age": 70, "favorite_colors": ["red"]},
-        {"name": "betty", "age": 65, "favorite_colors": ["red", "blue"]},
-        {"name": "ted", "age": 50, "favorite_colors": []},
-        {"name": "ben", "age": 75},
-    ]
+PEOPLE_WITH_LISTS_RECORDS = [
+    {"name": "arthur", "age": 70, "favorite_colors": ["red"]},
+    {"name": "betty", "age": 65, "favorite_colors": ["red", "blue"]},
+    {"name": "ted", "age": 50, "favorite_colors": []},
+    {"name": "ben", "age": 75},
+]
+
+PEOPLE_WITH_LISTS_DF = pd.DataFrame.from_records(PEOPLE_WITH_LISTS_RECORDS)
 
-    people_df = pd.DataFrame.from_records(people_records)
 
-    Person2.merge_df(people_df, deduplicate=False)
+def test_merge_df_with_lists(use_graph):
+    Person2.merge_df(PEOPLE_WITH_LISTS_DF, deduplicate=False)
 
     arthur = Person2.match("arthur")
     assert arthur.favorite_colors == ["red"]
@@ -766,16 +754,7 @@ def test_merge_df_with_lists(use_graph):
 
 
 def test_get_count(use_graph):
-    people_records = [
-        {"name": "arthur", "age": 70, "favorite_colors": ["red"]},
-        {"name": "betty", "age": 65, "favorite_colors": ["red", "blue"]},
-        {"name": "ted", "age": 50, "favorite_colors": []},
-        {"name": "ben", "age": 75},
-    ]
-
-    people_df = pd.DataFrame.from_records(people_records)
-
-    Person2.merge_df(people_df, deduplicate=False)
+    Person2.merge_records(PEOPLE_WITH_LISTS_RECORDS)
 
     assert Person2.get_count() == 4
 
@@ -864,20 +843,20 @@ def test_rels_schema_md():
 
 def test_related_nodes(use_graph):
     alice = AugmentedPerson(name="Alice")
-    alice.merge()
 
     bob = AugmentedPerson(name="Bob")
-    bob.merge()
+
+    AugmentedPerson.merge_nodes([alice, bob])
 
     follows = AugmentedPersonRelationship(
         source=alice, target=bob, follow_tag="test-tag"
     )
-    follows.merge()
 
     follows2 = AugmentedPersonRelationship(
         source=bob, target=alice, follow_tag="second-tag"
     )
-    follows2.merge()
+
+    AugmentedPersonRelationship.merge_relationships([follows, follows2])
 
     alice_rels = alice.get_related()
 
@@ -916,10 +895,10 @@ def test_related_nodes_unmerged(use_graph):
 
 def test_related_nodes_no_rels(use_graph):
     alice = AugmentedPerson(name="Alice")
-    alice.merge()
 
     bob = AugmentedPerson(name="Bob")
-    bob.merge()
+
+    AugmentedPerson.merge_nodes([alice, bob])
 
     alice_rels = alice.get_related()
 
@@ -928,10 +907,10 @@ def test_related_nodes_no_rels(use_graph):
 
 def test_retrieve_property(use_graph):
     alice = AugmentedPerson(name="Alice")
-    alice.merge()
 
     bob = AugmentedPerson(name="Bob")
-    bob.merge()
+
+    AugmentedPerson.merge_nodes([alice, bob])
 
     follows = AugmentedPersonRelationship(
         source=alice, target=bob, follow_tag="test-tag"
@@ -944,10 +923,10 @@ def test_retrieve_property(use_graph):
 
 def test_retrieve_property_none(use_graph):
     alice = AugmentedPerson(name="Alice")
-    alice.merge()
 
     bob = AugmentedPerson(name="Bob")
-    bob.merge()
+
+    AugmentedPerson.merge_nodes([alice, bob])
 
     assert bob.follower_count() == 0
     assert not bob.follower_names
@@ -955,10 +934,10 @@ def test_retrieve_property_none(use_graph):
 
 def test_retrieve_nodes_none(use_graph):
     alice = AugmentedPerson(name="Alice")
-    alice.merge()
 
     bob = AugmentedPerson(name="Bob")
-    bob.merge()
+
+    AugmentedPerson.merge_nodes([alice, bob])
 
     followers = bob.followers()
 
@@ -1,3 +1,4 @@
+import json
 from typing import ClassVar, Optional
 
 import pytest
@@ -453,3 +454,45 @@ def test_evaluate_query_node_links_simple(use_graph):
 
     assert len(node_link_data["nodes"]) == 2
     assert len(node_link_data["edges"]) == 1
+
+
+def test_evaluate_query_dump_json(use_graph):
+    foo = PracticeNodeGC(pp="foo")
+    bar = PracticeNodeGC(pp="bar")
+    rel1 = PracticeRelationshipGC(source=foo, target=bar)
+
+    foo.merge()
+    bar.merge()
+
+    rel1.merge()
+
+    gc = GraphConnection()
+
+    cypher = "MATCH (n)-[r]->(o) RETURN n,r,o"
+
+    results = gc.evaluate_query(cypher)
+
+    dumped = json.loads(results.neontology_dump_json())
+
+    assert dumped == results.neontology_dump()
+
+
+class PracticeFloatNodeGC(BaseNode):
+    __primaryproperty__: ClassVar[str] = "pp"
+    __primarylabel__: ClassVar[Optional[str]] = "PracticeFloatNodeGC"
+    pp: str
+    float_prop: float
+
+
+@pytest.mark.parametrize("float_value", [float("inf"), float("nan")])
+def test_evaluate_query_dump_json_non_finite_float(use_graph, float_value):
+    PracticeFloatNodeGC(pp="foo", float_prop=float_value).merge()
+
+    gc = GraphConnection()
+
+    results = gc.evaluate_query("MATCH (n:PracticeFloatNodeGC) RETURN n")
+
+    # non-finite floats aren't valid json, so they're written as null
+    dumped = json.loads(results.neontology_dump_json())
+
+    assert dumped["nodes"][0]["float_prop"] is None
@@ -0,0 +1,86 @@
+from typing import List, Optional, Union
+
+import pytest
+from pydantic import BaseModel
+
+from neontology.schema_utils import extract_type_mapping, get_schema_properties
+
+
+def test_extract_type_mapping_plain_type():
+    result = extract_type_mapping(str)
+
+    assert result.representation == "str"
+    assert result.core_type is str
+    assert result.optional is False
+
+
+@pytest.mark.parametrize("annotation", [Optional[int], Union[None, int]])
+def test_extract_type_mapping_optional(annotation):
+    result = extract_type_mapping(annotation)
+
+    assert result.representation == "Optional[int]"
+    assert result.core_type is int
+    assert result.optional is True
+
+
+def test_extract_type_mapping_optional_hidden():
+    result = extract_type_mapping(Optional[List[int]], show_optional=False)
+
+    assert result.representation == "List[int]"
+    assert result.optional is False
+
+
+@pytest.mark.parametrize(
+    "annotation, representation",
+    [
+        (List[str], "List[str]"),
+        (list[str], "List[str]"),
+        (List[Optional[int]], "List[Optional[int]]"),
+    ],
+)
+def test_extract_type_mapping_list(annotation, representation):
+    result = extract_type_mapping(annotation)
+
+    assert result.representation == representation
+    assert result.core_type == annotation
+
+
+def test_extract_type_mapping_bad_union():
+    with pytest.raises(TypeError):
+        extract_type_mapping(Union[int, str])
+
+
+class SchemaPropertiesModel(BaseModel):
+    first: str
+    second: int
+    optional: Optional[str] = None
+    skipped: str
+
+
+def test_get_schema_properties():
+    properties = get_schema_properties(
+        SchemaPropertiesModel, exclude=frozenset({"skipped"})
+    )
+
+    assert [x.name for x in properties] == ["second", "first", "optional"]
+    assert [x.required for x in properties] == [True, True, False]
+
+    # results are cached per model
+    assert (
+        get_schema_properties(SchemaPropertiesModel, exclude=frozenset({"skipped"}))
+        is properties
+    )
+
+
+def test_get_schema_properties_rebuilt_model():
+    class RebuiltSchemaModel(BaseModel):
+        first: str
+
+    properties = get_schema_properties(RebuiltSchemaModel)
+
+    # rebuilding a model (e.g. to resolve forward references) shouldn't
+    # leave stale cached properties behind
+    RebuiltSchemaModel.model_rebuild(force=True)
+
+    assert get_schema_properties(RebuiltSchemaModel) is not properties
+    assert get_schema_properties(RebuiltSchemaModel) == properties
@@ -1,3 +1,5 @@
+from copy import deepcopy
+from types import SimpleNamespace
 from uuid import uuid4, UUID
 from typing import ClassVar
 import logging
@@ -6,7 +8,7 @@ import pytest
 from pydantic import Field, ValidationError, field_serializer
 
 from neontology import BaseNode, BaseRelationship
-from neontology.tools.import_records import import_records
+from neontology.tools.import_records import _check_unmatched, import_records
 
 logger = logging.getLogger(__name__)
 
@@ -174,6 +176,75 @@ def test_import_records_sub_record_targets(use_graph):
     assert len(FollowsImportRel.match_relationships()) == 1
 
 
+class LowerImportNode(BaseNode):
+    __primarylabel__: ClassVar[str] = "LowerImportLabel"
+    __primaryproperty__: ClassVar[str] = "name"
+
+    name: str
+
+    def model_post_init(self, __context):
+        self.name = self.name.lower()
+
+
+class LowerFollowsImportRel(BaseRelationship):
+    __relationshiptype__: ClassVar[str] = "IMPORT_LOWER_FOLLOWS"
+
+    source: LowerImportNode
+    target: LowerImportNode
+
+
+def test_import_records_sub_record_pp_from_node(use_graph):
+    # relationships must use the pp of the node as built, not the raw input value
+    with_sub_records = {
+        "LABEL": "LowerImportLabel",
+        "name": "BOB",
+        "RELATIONSHIPS_OUT": [
+            {
+                "TARGET_NODES": [{"LABEL": "LowerImportLabel", "name": "ALICE"}],
+                "RELATIONSHIP_TYPE": "IMPORT_LOWER_FOLLOWS",
+                "TARGET_LABEL": "LowerImportLabel",
+            }
+        ],
+    }
+
+    import_records([with_sub_records], error_on_unmatched=True)
+
+    assert {x.name for x in LowerImportNode.match_nodes()} == {"bob", "alice"}
+    assert len(LowerFollowsImportRel.match_relationships()) == 1
+
+
+def test_import_records_does_not_modify_input(use_graph):
+    with_sub_records = [
+        {
+            "LABEL": "PersonImportLabel",
+            "name": "Bob",
+            "age": 84,
+            "RELATIONSHIPS_OUT": [
+                {
+                    "TARGETS": ["Alice"],
+                    "RELATIONSHIP_TYPE": "IMPORT_FOLLOWS",
+                    "TARGET_LABEL": "PersonImportLabel",
+                    "import_follows_prop_1": "TEST IMPORT FOLLOWS PROPERTY VALUE",
+                }
+            ],
+        },
+        {
+            "LABEL": "PersonImportLabel",
+            "name": "Alice",
+            "age": 76,
+        },
+    ]
+
+    link_data = {"nodes": [], "edges": []}
+
+    expected = deepcopy(with_sub_records)
+
+    import_records([with_sub_records, link_data], error_on_unmatched=True)
+
+    assert with_sub_records == expected
+    assert link_data == {"nodes": [], "edges": []}
+
+
 def test_import_records_bad_node(use_graph):
     bad_records = [
         {
@@ -202,3 +273,36 @@ def test_import_records_bad_node_validate_only(use_graph):
 
     with pytest.raises(ValidationError):
         import_records(bad_records, validate_only=True, error_on_unmatched=True)
+
+
+class UnmatchedGraphConnection:
+    """Stand in for the graph, reporting no matches for the first target."""
+
+    def __init__(self):
+        self.params = None
+
+    def evaluate_query_single(self, cypher, params):
+        self.params = params
+        return [{"idx": 0, "matches": 0}]
+
+
+def test_check_unmatched_reports_each_relationship(caplog):
+    gc = UnmatchedGraphConnection()
+
+    # unhashable targets (e.g. lists from JSON) should be checked too
+    rel_entries = [
+        SimpleNamespace(target=["Missing"]),
+        SimpleNamespace(target="Alice"),
+        SimpleNamespace(target=["Missing"]),
+    ]
+
+    with caplog.at_level(logging.WARNING):
+        _check_unmatched(
+            gc, "IMPORT_FOLLOWS", "PersonImportLabel", "name", rel_entries, False
+        )
+
+    # each distinct target is only looked up once
+    assert gc.params == {"vals": [["Missing"], "Alice"]}
+
+    # but every unmatched relationship is reported
+    assert caplog.text.count("No target node for IMPORT_FOLLOWS to ['Missing']") == 2
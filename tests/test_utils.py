@@ -1,6 +1,7 @@
 from typing import ClassVar, Optional
 
 from neontology.utils import (
+    all_subclasses,
     get_rels_by_source,
     get_node_types,
     apply_neo4j_constraints,
@@ -30,6 +31,15 @@ def test_get_rels_by_source():
     assert rels_by_source["MyNodeType"] == {"MY_REL_TYPE"}
 
 
+def test_get_rels_by_source_returns_copy():
+    rels_by_source = get_rels_by_source()
+
+    rels_by_source["NotARealLabel"] = frozenset({"NOT_A_REAL_REL"})
+
+    assert "NotARealLabel" not in get_rels_by_source()
+    assert isinstance(get_rels_by_source()["NotARealLabel"], frozenset)
+
+
 def test_get_rels_by_type_subclasses():
     class MyNodeType1(BaseNode):
         __primarylabel__: ClassVar[Optional[str]] = "MyNodeType1"
@@ -73,6 +83,68 @@ def test_no_primary_label_get_node_types():
     assert "SpecialPracticeLabelNode" not in node_types.keys()
 
 
+def test_get_node_types_new_subclass():
+    class CachedAbstractNodeType(BaseNode):
+        __primaryproperty__: ClassVar[str] = "pp"
+        pp: str
+
+    assert get_node_types(CachedAbstractNodeType) == {}
+
+    class CachedNodeType(CachedAbstractNodeType):
+        __primarylabel__: ClassVar[Optional[str]] = "CachedNodeType"
+
+    # defining a new node type should invalidate any cached lookups
+    assert get_node_types(CachedAbstractNodeType) == {"CachedNodeType": CachedNodeType}
+    assert get_node_types()["CachedNodeType"] is CachedNodeType
+
+
+def test_get_node_types_returns_copy():
+    node_types = get_node_types()
+
+    node_types["NotARealLabel"] = BaseNode
+
+    assert "NotARealLabel" not in get_node_types()
+
+
+def test_all_subclasses():
+    class SubclassesRoot(BaseNode):
+        __primaryproperty__: ClassVar[str] = "pp"
+        pp: str
+
+    class SubclassesChild(SubclassesRoot):
+        pass
+
+    assert all_subclasses(SubclassesRoot) == {SubclassesChild}
+
+    class SubclassesGrandchild(SubclassesChild):
+        pass
+
+    # subclasses defined later should be found
+    assert all_subclasses(SubclassesRoot) == {SubclassesChild, SubclassesGrandchild}
+
+
+def test_all_subclasses_other_hierarchy():
+    class OtherRoot:
+        pass
+
+    class OtherChild(OtherRoot):
+        pass
+
+    subclasses = all_subclasses(OtherRoot)
+
+    assert subclasses == {OtherChild}
+
+    # callers get their own mutable set
+    subclasses.add(OtherRoot)
+
+    class OtherGrandchild(OtherChild):
+        pass
+
+    # classes outside neontology don't invalidate any caches
+    # so the result must not be cached
+    assert all_subclasses(OtherRoot) == {OtherChild, OtherGrandchild}
+
+
 class SpecialPracticeNodeAC(BaseNode):
     __primaryproperty__: ClassVar[str] = "pp"
     __primarylabel__: ClassVar[str] = "SpecialPracticeNodeAC"